@@ -1,4 +1,4 @@
-from pathlib import Path
+import shutil
 
 files_to_merge = [
     "load_credentials.py",
@@ -11,8 +11,10 @@ files_to_merge = [
     "main.py"
 ]
 
-with open("general_schema_v2.py", "w") as outfile:
+with open("general_schema_v2.py", "wb") as outfile:
     for fname in files_to_merge:
-        content = Path(fname).read_text()
-        outfile.write(f"# --- {fname} ---\n")
-        outfile.write(content + "\n\n")
+        outfile.write(f"# --- {fname} ---\n".encode())
+        # Copy the raw bytes, no decode/encode round-trip
+        with open(fname, "rb") as infile:
+            shutil.copyfileobj(infile, outfile, length=1 << 20)
+        outfile.write(b"\n\n")
@@ -1,6 +1,14 @@
+import base64
+import functools
+import json
+import os
+import random
+import time
+
 import gspread
 import pandas as pd
-from oauth2client.service_account import ServiceAccountCredentials
+from google.oauth2.service_account import Credentials
+from gspread.exceptions import APIError
 
 from elt.exceptions import ExtractionError
 from elt.logger import get_logger
@@ -8,14 +16,172 @@ from elt.logger import get_logger
 # Set the logger
 logger = get_logger(__name__)
 
-def extract() -> tuple[pd.DataFrame, pd.DataFrame]:
+CREDS_FILE = "book_tracker_creds.json"
+CREDS_ENV_VAR = "BOOK_TRACKER_CREDS_B64"
+SPREADSHEET_ID = "1mRx4CClu1io5Ievu9b5PTJ6nIEDOFfl-oFgIv55Q37g"
+SCOPE = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive"
+]
+SHEET_RANGES = ["books", "consolidate"]
+CACHE_FILE = ".sheets_cache.json"
+# Numbers come back typed; dates as serial numbers (parsed in transform)
+VALUE_RENDER_PARAMS = {
+    "valueRenderOption": "UNFORMATTED_VALUE",
+    "dateTimeRenderOption": "SERIAL_NUMBER"
+}
+RETRY_STATUS_CODES = {429, 500, 503}
+
+
+def retry_on_quota(max_tries: int = 6, base: float = 1.0):
+    """
+    Retry a Google API call with exponential backoff and jitter.
+
+    Only `APIError`s with a quota (429) or transient server status (500, 503) are
+    retried, sleeping `base * 2**attempt + random()` seconds between tries. Any other
+    error, or the last failed try, is raised to the caller.
+
+    Parameters
+    ----------
+    max_tries : int, optional
+        Maximum number of calls before giving up, by default 6.
+    base : float, optional
+        Base delay in seconds for the backoff, by default 1.0.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_tries):
+                try:
+                    return func(*args, **kwargs)
+                except APIError as e:
+                    status = e.response.status_code
+                    if status not in RETRY_STATUS_CODES or attempt == max_tries - 1:
+                        raise
+                    delay = base * 2 ** attempt + random.random()
+                    logger.warning(f"Google API returned {status}. Retrying in {delay:.1f}s...")
+                    time.sleep(delay)
+        return wrapper
+    return decorator
+
+
+@functools.lru_cache(maxsize=1)
+def _authorized_client(encoded_creds: str | None, creds_mtime: float | None) -> gspread.Client:
+    """
+    Authorize a gspread client and reuse it for later extractions.
+
+    The base64 credentials in `CREDS_ENV_VAR` are decoded in memory, so the key never
+    touches the disk; `CREDS_FILE` is only read when the variable is not set. The cache
+    is keyed on both sources, so changed credentials are picked up.
+    """
+
+    if encoded_creds:
+        creds_info = json.loads(base64.b64decode(encoded_creds))
+        creds = Credentials.from_service_account_info(creds_info, scopes=SCOPE)
+    else:
+        creds = Credentials.from_service_account_file(CREDS_FILE, scopes=SCOPE)
+    return gspread.authorize(creds)
+
+
+def _to_dataframe(rows: list[list]) -> pd.DataFrame:
+    """
+    Build a DataFrame from the raw rows of a worksheet (header row first).
+
+    The Sheets API drops trailing empty cells, so shorter rows are padded with
+    empty strings, and cells past the last header column are dropped, as
+    `get_all_records()` does.
+    """
+
+    if not rows:
+        return pd.DataFrame()
+
+    header, body = rows[0], rows[1:]
+    width = len(header)
+    records = [row[:width] + [""] * (width - len(row)) for row in body]
+
+    return pd.DataFrame(records, columns=header)
+
+
+@retry_on_quota()
+def _batch_get(client: gspread.Client) -> dict:
+    """Fetch the values of all `SHEET_RANGES` in a single request."""
+
+    # gspread adds the ranges to `params`, so pass a copy to keep the constant intact
+    return client.http_client.values_batch_get(
+        SPREADSHEET_ID, SHEET_RANGES, params=dict(VALUE_RENDER_PARAMS)
+    )
+
+
+@retry_on_quota()
+def _modified_time(client: gspread.Client) -> str:
+    """Fetch the spreadsheet's last modification time from the Drive API."""
+
+    return client.http_client.get_file_drive_metadata(SPREADSHEET_ID)["modifiedTime"]
+
+
+def _read_cache(cache_path: str) -> dict | None:
+    """Return the cached sheet values, or None if the cache is missing or unreadable."""
+
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        logger.warning("Unreadable sheet cache. Downloading the values again.")
+        return None
+
+    return cache if isinstance(cache, dict) else None
+
+
+def _fetch_value_ranges(client: gspread.Client, directory: str | None) -> list[dict]:
+    """
+    Return the value ranges of `SHEET_RANGES`.
+
+    When `directory` is given, the values are cached there along with the spreadsheet's
+    `modifiedTime` and the ranges and render options that produced them. The cache is
+    returned as-is while all of those are unchanged.
+    """
+
+    if directory is None:
+        return _batch_get(client)["valueRanges"]
+
+    cache_path = os.path.join(directory, CACHE_FILE)
+    # Whatever the cached values depend on; any difference is a cache miss
+    cache_key = {
+        "modifiedTime": _modified_time(client),
+        "ranges": list(SHEET_RANGES),
+        "params": dict(VALUE_RENDER_PARAMS)
+    }
+    cache = _read_cache(cache_path)
+    if cache is not None and cache.get("key") == cache_key and "valueRanges" in cache:
+        logger.info("No changes in the spreadsheet since the last run. Using cached data.")
+        return cache["valueRanges"]
+
+    value_ranges = _batch_get(client)["valueRanges"]
+    with open(cache_path, "w") as f:
+        json.dump({"key": cache_key, "valueRanges": value_ranges}, f)
+
+    return value_ranges
+
+
+def extract(directory: str | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Extracts data from a Google Sheets document and returns two DataFrames.
 
-    This function connects to a Google Sheets file using service account credentials,
-    retrieves data from two specific worksheets ("books" and "consolidate"), and returns
-    them as pandas DataFrames. It handles authentication, sheet access, and logs the
-    extraction process.
+    This function connects to a Google Sheets file using service account credentials
+    (from the `BOOK_TRACKER_CREDS_B64` environment variable or `book_tracker_creds.json`),
+    retrieves data from two specific worksheets ("books" and "consolidate") with a single
+    batched request, and returns them as pandas DataFrames. It handles authentication,
+    sheet access, and logs the extraction process.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory where the sheet values are cached (`.sheets_cache.json`). When given,
+        the values are only downloaded if the spreadsheet was modified since the last
+        run. By default None, which always downloads them.
 
     Returns
     -------
@@ -27,32 +193,37 @@ def extract() -> tuple[pd.DataFrame, pd.DataFrame]:
     Raises
     ------
     ExtractionError
-        If authentication fails or if the specified worksheets cannot be accessed.
+        If authentication fails or if the specified worksheets cannot be accessed
+        (quota and transient server errors are retried first).
     """
 
-    # File extraction from Google Sheets
+    # Authentication for Google Sheets (cached after the first call)
     try:
-        scope = [
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive"
-        ]
-
-        creds = ServiceAccountCredentials.from_json_keyfile_name("book_tracker_creds.json", scope)
-        client = gspread.authorize(creds)
-        # Sheet retrieval
-        sheets = client.open_by_key("1mRx4CClu1io5Ievu9b5PTJ6nIEDOFfl-oFgIv55Q37g")
+        encoded_creds = os.getenv(CREDS_ENV_VAR)
+        creds_mtime = None if encoded_creds else os.path.getmtime(CREDS_FILE)
+        client = _authorized_client(encoded_creds, creds_mtime)
 
     except Exception as e:
         logger.exception("Data extraction failed.")
         raise ExtractionError(f"{e}")
 
-    # Getting books and consolidate sheets
+    # Getting books and consolidate sheets in one round-trip (or from the cache)
     try:
-        books_ws = sheets.worksheet("books")
-        consolidate_ws = sheets.worksheet("consolidate")
+        try:
+            value_ranges = _fetch_value_ranges(client, directory)
+        except APIError as e:
+            if e.response.status_code != 401:
+                raise
+            # Authorization no longer valid: authorize again and retry once
+            logger.warning("Google API authorization expired. Re-authorizing...")
+            _authorized_client.cache_clear()
+            value_ranges = _fetch_value_ranges(_authorized_client(encoded_creds, creds_mtime), directory)
+        books_rows, consolidate_rows = (
+            value_range.get("values", []) for value_range in value_ranges
+        )
 
-        books_current = pd.DataFrame(books_ws.get_all_records()) # Current format
-        consolidate = pd.DataFrame(consolidate_ws.get_all_records()) # Previous format
+        books_current = _to_dataframe(books_rows) # Current format
+        consolidate = _to_dataframe(consolidate_rows) # Previous format
 
         return books_current, consolidate
 
@@ -1,6 +1,10 @@
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pcsv
 
 from elt.logger import get_logger
 from elt.exceptions import LoadError
@@ -8,37 +12,113 @@ from elt.exceptions import LoadError
 # Set logger
 logger = get_logger(__name__)
 
+# Book dates, fetched as Sheets serial numbers (see `VALUE_RENDER_PARAMS` in extract)
+DATE_COLS = ["start_date", "end_date"]
+
+def _serial_to_iso(col: pd.Series) -> pd.Series:
+    """
+    Format Google Sheets date serial numbers (days since 1899-12-30) as YYYY-MM-DD, so the
+    CSV dumps keep readable dates. Blank and non-numeric cells are kept as they are.
+    """
+
+    serials = pd.to_numeric(col, errors="coerce")
+    dates = pd.to_datetime(serials, unit="D", origin="1899-12-30").dt.strftime("%Y-%m-%d")
+
+    return dates.where(serials.notna(), col)
+
+
+def _read_last_record(file_path: str, chunk: int = 1024) -> dict | None:
+    """
+    Return the last record in `file_path`, or None if the file is empty. The file is read
+    backwards in `chunk`-sized steps, only until the last line is complete.
+    """
+
+    with open(file_path, "rb") as f:
+        end = pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        # Stop once a newline precedes the last line (or the whole file was read)
+        while pos > 0 and b"\n" not in tail.strip():
+            pos = max(pos - chunk, 0)
+            f.seek(pos)
+            tail = f.read(end - pos)
+
+    last_line = tail.strip().rsplit(b"\n", 1)[-1]
+    if not last_line:
+        return None
+
+    return json.loads(last_line)
+
+
+def _write_csv(df: pd.DataFrame, path: str):
+    """
+    Write `df` to `path` as CSV with pyarrow's multithreaded writer.
+
+    Sheet columns mixing numbers and empty strings are stored as `object`, which Arrow
+    can't type, so those columns are cast to strings first (blanks stay blank).
+    """
+
+    mixed_cols = df.columns[df.dtypes == object]
+    table = pa.Table.from_pandas(
+        df.astype({col: "string" for col in mixed_cols}),
+        preserve_index=False
+    )
+    pcsv.write_csv(table, path)
+
+
 # Avoid duplicates in records
 def log_record_if_new(
     directory: str,
-    today: pd.Timestamp,
+    today: str,
     current_count: int
 ):
     """
-    Append a new record to `raw_records.csv` if the last entry does not match the current count.
+    Append a new record to `raw_records.jsonl` if the last entry does not match the current count.
+
+    The last record is mirrored in `raw_records.state` along with the log's size in bytes,
+    so the log itself is only read when that file is missing or the log no longer matches
+    it (e.g. it was deleted, recreated or migrated).
 
     Parameters
     ----------
     directory : str
-        Path to the directory containing `records.csv`.
-    today : pd.Timestamp
-        Timestamp representing the current extraction time.
+        Path to the directory containing `raw_records.jsonl`.
+    today : str
+        ISO-formatted timestamp representing the current extraction time.
     current_count : int
         Number of records extracted in the current run.
 
     Raises
     ------
     FileNotFoundError
-        If `raw_records.csv` does not exist in the specified directory.
+        If `raw_records.jsonl` does not exist in the specified directory.
     """
 
-    file_path = os.path.join(directory, "raw_records.csv")
-    new_record = pd.DataFrame({"date": [today], "records_current": [current_count]})
-    
+    file_path = os.path.join(directory, "raw_records.jsonl")
+    state_path = os.path.join(directory, "raw_records.state")
+
+    # Last record: from the state file, or from the log tail if there is no valid state
+    state = None
+    if os.path.exists(state_path):
+        try:
+            with open(state_path) as f:
+                state = json.load(f)
+        except ValueError:
+            logger.warning("Unreadable raw_records.state. Rebuilding it from the log.")
+    # The state is only trusted while the log has the size it recorded; older formats are rebuilt
+    has_state = isinstance(state, dict) and state.get("log_size") == os.path.getsize(file_path)
+    last_record = state["record"] if has_state else _read_last_record(file_path)
+
     # Check if the last entry is equal to the current
-    existing = pd.read_csv(file_path)
-    if existing.empty or int(existing["records_current"].iloc[-1]) != current_count:
-        new_record.to_csv(file_path, mode="a", header=False, index=False)
+    if last_record is None or last_record["records_current"] != current_count:
+        last_record = {"date": today, "records_current": current_count}
+        with open(file_path, "ab") as f:
+            f.write(json.dumps(last_record, separators=(",", ":")).encode() + b"\n")
+    elif has_state:
+        return
+
+    state = {"log_size": os.path.getsize(file_path), "record": last_record}
+    with open(state_path, "w") as f:
+        json.dump(state, f, separators=(",", ":"))
 
 
 def load(
@@ -50,7 +130,7 @@ def load(
 
     """
     Load extracted data from the origin and optionally save it to disk, logging record counts
-    as `raw_records.csv`.
+    as `raw_records.jsonl`.
 
     Parameters
     ----------
@@ -77,10 +157,10 @@ def load(
 
     # Validate parameter types
     if not isinstance(directory, str):
-        logger.exception("Invalid parameter format: directory")
+        logger.error("Invalid parameter format: directory")
         raise ValueError("A valid directory is a string.") 
     if not isinstance(save_df, bool):
-        logger.exception("Invalid parameter format: save_df")
+        logger.error("Invalid parameter format: save_df")
         raise ValueError("The parameter to save the DataFrame must be a bool.")
 
     # Validate directory existence
@@ -89,17 +169,21 @@ def load(
     
     # Validate dataframes are not empty
     if raw_books_current.empty:
-        logger.exception("Empty DataFrame.")
+        logger.error("Empty DataFrame.")
         raise ValueError("Empty DataFrame: books_current. Can't proceed.")
     if raw_consolidate.empty:
-        logger.exception("Empty DataFrame.")
+        logger.error("Empty DataFrame.")
         raise ValueError("Empty DataFrame: consolidate. Can't proceed.")
     
-    # Create an empty records.csv in the provided directory (only in the first call)
-    file_path = os.path.join(directory, "raw_records.csv")
+    # Create an empty raw_records.jsonl in the provided directory (only in the first call)
+    file_path = os.path.join(directory, "raw_records.jsonl")
     if not os.path.exists(file_path):
-        empty_csv = pd.DataFrame({"date": [], "records_current": []})
-        empty_csv.to_csv(file_path, index=False)
+        legacy_path = os.path.join(directory, "raw_records.csv")
+        if os.path.exists(legacy_path):
+            # Carry over the history tracked by the previous CSV format
+            pd.read_csv(legacy_path, dtype={"date": str}).to_json(file_path, orient="records", lines=True)
+        else:
+            open(file_path, "w").close()
 
     # Tracking
     today = pd.Timestamp.now().isoformat() # To add in the record tracking
@@ -108,8 +192,18 @@ def load(
     # Save dataframes if needed
     if save_df:
         try:
-            raw_books_current.to_csv(os.path.join(directory, "raw_books_current.csv"), index=False)
-            raw_consolidate.to_csv(os.path.join(directory, "raw_consolidate.csv"), index=False)
+            dumps = (
+                (
+                    raw_books_current.assign(**{col: _serial_to_iso(raw_books_current[col]) for col in DATE_COLS}),
+                    os.path.join(directory, "raw_books_current.csv")
+                ),
+                (raw_consolidate, os.path.join(directory, "raw_consolidate.csv"))
+            )
+            # Both writes are independent, so run them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(_write_csv, df, path) for df, path in dumps]
+                for future in futures:
+                    future.result() # Re-raise any write error
 
         except Exception as e:
             logger.exception("Loading process failed: raw book DataFrames.")
@@ -1,14 +1,17 @@
+import functools
 import logging
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
-    """Set a logger instance."""
+    """Set a logger instance (memoized: one setup per name)."""
     
     # Retrieve a logger instance with the given name
     logger = logging.getLogger(name)
     
     # Prevent multiple handlers from being added to the same logger
     # Handler: decides where the logs go (console, file, etc.)
-    if not logger.hasHandlers():
+    # Only this logger's own handlers matter, no need to walk its parents
+    if not logger.handlers:
         # Create a handler to output logs to the console
         handler = logging.StreamHandler()
         # How the message will look like
@@ -2,6 +2,8 @@ import os
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.json as pajson
 
 from elt.logger import get_logger
 from elt.exceptions import TransformationError
@@ -9,6 +11,93 @@ from elt.exceptions import TransformationError
 # Set logger
 logger = get_logger(__name__)
 
+# Compact dtypes for the metric columns; status only takes a handful of values.
+# score and pages_per_day stay float64: float32 changes how they display (7.3 prints as
+# 7.300000190734863) and how their averages round
+METRIC_DTYPES = {
+    "days": "Int32",
+    "status": "category"
+}
+# Arrow-backed strings for the text columns shown in the report
+TEXT_DTYPES = {
+    "book_name": "string[pyarrow]",
+    "author": "string[pyarrow]"
+}
+DATE_COLS = ["start_date", "end_date"]
+RECORDS_SCHEMA = pa.schema([
+    ("date", pa.timestamp("us")),
+    ("records_current", pa.int32())
+])
+
+
+def _serial_to_datetime(col: pd.Series) -> pd.Series:
+    """
+    Convert Google Sheets date serial numbers (days since 1899-12-30) to datetimes.
+
+    Cells that are not numbers (text-typed sheet cells, dates in the CSV dumps) are
+    parsed as YYYY-MM-DD instead. Blank cells become NaT; any other cell that can't be
+    parsed also becomes NaT, and is logged as an error.
+    """
+
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return col
+
+    serials = pd.to_numeric(col, errors="coerce")
+    dates = pd.to_datetime(serials, unit="D", origin="1899-12-30")
+
+    # Non-blank cells that are not serial numbers
+    text = col[serials.isna() & col.notna()].astype(str).str.strip()
+    text = text[text != ""]
+    if not text.empty:
+        parsed = pd.to_datetime(text, format="%Y-%m-%d", errors="coerce")
+        dates[parsed.index] = parsed
+        invalid = parsed.isna()
+        if invalid.any():
+            logger.error(
+                f"{invalid.sum()} value(s) in '{col.name}' are not valid dates "
+                f"(e.g. {text[invalid].iloc[0]!r}) and were set to NaT."
+            )
+
+    return dates
+
+
+def _read_records(file_path: str) -> pd.DataFrame:
+    """
+    Read the records log with Arrow's JSON reader, typed by `RECORDS_SCHEMA` so dates
+    are parsed while reading and any other field is skipped. An empty log gives an
+    empty DataFrame with both columns.
+    """
+
+    if os.path.getsize(file_path) == 0:
+        return RECORDS_SCHEMA.empty_table().to_pandas()
+
+    parse_options = pajson.ParseOptions(
+        explicit_schema=RECORDS_SCHEMA,
+        unexpected_field_behavior="ignore"
+    )
+    return pajson.read_json(file_path, parse_options=parse_options).to_pandas()
+
+
+def _add_time_columns(books: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the reading duration (`days`) and rate (`pages_per_day`) columns, computed on
+    the underlying NumPy arrays, and cast the metric and text columns to `METRIC_DTYPES`
+    and `TEXT_DTYPES`.
+    """
+
+    start = books["start_date"].to_numpy().astype("datetime64[D]")
+    end = books["end_date"].to_numpy().astype("datetime64[D]")
+    days = (end - start) / np.timedelta64(1, "D") # NaN for unfinished books
+    pages = pd.to_numeric(books["total_pages"], errors="coerce").to_numpy(dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pages_per_day = np.round(pages / days, 2)
+
+    books["days"] = days
+    books["pages_per_day"] = pages_per_day
+
+    return books.astype(METRIC_DTYPES | TEXT_DTYPES)
+
+
 def transform(
     directory: str,
     raw_books_current: pd.DataFrame,
@@ -22,12 +111,12 @@ def transform(
     This function gets 'raw_books_current' and 'raw_consolidate' data either from saved CSV files or
     directly from the source via `extract()` output. It parses relevant date columns, computes
     reading duration and reading rate metrics, and returns the processed datasets, along
-    with the records tracking with parsed dates in `transformed_records.csv`.
+    with the records tracking from `raw_records.jsonl` with parsed dates.
 
     Parameters
     ----------
     directory : str
-        Path to the directory containing the CSV files.
+        Path to the directory containing the CSV and JSON Lines files.
     raw_books_current : pd.DataFrame
         Book database with the current format (from extract).
     raw_consolidate : pd.DataFrame
@@ -55,32 +144,29 @@ def transform(
         try:
             # Transform: raw_books_current
 
-            # Parse dates
+            # Parse dates (stored as serial numbers)
             transformed_books_current = pd.read_csv(
                 os.path.join(directory, "raw_books_current.csv"),
-                parse_dates=["start_date", "end_date"]
+                engine="pyarrow"
             )
+            transformed_books_current[DATE_COLS] = \
+            transformed_books_current[DATE_COLS].apply(_serial_to_datetime)
 
             # Time-related columns
-            transformed_books_current["days"] = \
-            (transformed_books_current["end_date"] - transformed_books_current["start_date"]).dt.days
-            transformed_books_current["pages_per_day"] = \
-            (transformed_books_current["total_pages"] / transformed_books_current["days"]).round(2)
+            transformed_books_current = _add_time_columns(transformed_books_current)
             
             # Transform: raw_consolidate
 
             # Get the data from CSV
             transformed_consolidate = pd.read_csv(
-                os.path.join(directory, "raw_consolidate.csv")
+                os.path.join(directory, "raw_consolidate.csv"),
+                engine="pyarrow"
             )
 
             # Transform: raw_records
 
-            # Get the data from CSV and parse dates
-            transformed_records = pd.read_csv(
-                os.path.join(directory, "raw_records.csv"),
-                parse_dates=["date"]
-            )
+            # Get the data from JSON Lines and parse dates
+            transformed_records = _read_records(os.path.join(directory, "raw_records.jsonl"))
 
             return transformed_books_current, transformed_consolidate, transformed_records
 
@@ -93,30 +179,24 @@ def transform(
             # Transform: raw_books_current
             
             # Parse dates
-            transformed_books_current = raw_books_current.copy()
-            # Replace empties with nulls
-            transformed_books_current["end_date"] = transformed_books_current["end_date"].replace("", np.nan)
-            for col in ["start_date", "end_date"]:
-                transformed_books_current[col] = pd.to_datetime(transformed_books_current[col])
+            # Shallow copy: columns are replaced below, never written in place
+            transformed_books_current = raw_books_current.copy(deep=False)
+            # Serial numbers to datetimes (empties become nulls)
+            transformed_books_current[DATE_COLS] = \
+            transformed_books_current[DATE_COLS].apply(_serial_to_datetime)
 
             # Force column dtype: score must be float
             transformed_books_current["score"] = pd.to_numeric(transformed_books_current["score"], errors="coerce")
             
             # Time-related columns
-            transformed_books_current["days"] = \
-            (transformed_books_current["end_date"] - transformed_books_current["start_date"]).dt.days
-            transformed_books_current["pages_per_day"] = \
-            (transformed_books_current["total_pages"] / transformed_books_current["days"]).round(2)
+            transformed_books_current = _add_time_columns(transformed_books_current)
             
             # Transform: raw_consolidate (skipped: no transformation needed)
             
             # Transform: raw_records
 
-            # Get data from CSV and parse dates
-            transformed_records = pd.read_csv(
-                os.path.join(directory, "raw_records.csv"),
-                parse_dates=["date"]
-            )
+            # Get data from JSON Lines and parse dates
+            transformed_records = _read_records(os.path.join(directory, "raw_records.jsonl"))
 
             return transformed_books_current, raw_consolidate, transformed_records
         
@@ -55,9 +55,8 @@ def load():
     else:
         new_entries.to_csv("./database/books.csv", mode="a", index=False, header=False)
 
-        print("Added:")
-        for name, author in zip(new_entries["book_name"].tolist(), new_entries["author"].tolist()):
-            print(f" ➺  {name} by {author}")
+        added = " ➺  " + new_entries["book_name"].astype(str) + " by " + new_entries["author"].astype(str)
+        print("Added:\n" + "\n".join(added))
         print("\n")
 
 
@@ -26,7 +26,7 @@ def main():
     try:
         # Extraction
         logger.info("Starting extraction...")
-        raw_books_current, raw_consolidate = extract()
+        raw_books_current, raw_consolidate = extract(directory=directory)
 
         # Loading
         logger.info("Loading data...")
@@ -1,6 +1,25 @@
-from rich.console import Console
+import numpy as np
+import pandas as pd
+from rich.console import Console, Group
 from rich.table import Table
 
+
+def _df_table(df: pd.DataFrame, title: str, header_style: str, rows: np.ndarray | None = None) -> Table:
+    """
+    Build a `rich.Table` from `df`, with the headers in `df.attrs["display_cols"]`.
+    Cells are the frame's values as strings, unless preformatted `rows` are given.
+    """
+
+    table = Table(show_header=True, header_style=header_style, title=title)
+    for header in df.attrs["display_cols"]:
+        table.add_column(header, style="white")
+    # Make sure values are strings (one vectorized cast for the whole frame)
+    for row in df.to_numpy().astype(str) if rows is None else rows:
+        table.add_row(*row)
+
+    return table
+
+
 def report(results: dict):
     """
     Displays a formatted reading report using CLI tables.
@@ -19,13 +38,17 @@ def report(results: dict):
         - 'days_since_last'
         - 'best', 'last', 'new_entries', `feedback_new`
 
+        The DataFrames carry their column headers in `attrs["display_cols"]`.
+
     Returns
     -------
     None
-        Output is printed directly to the console.
+        Output is printed directly to the console, in a single call.
     """
     
     console = Console()
+    # Renderables in display order; "" leaves a blank line. Printed at once at the end
+    renderables = []
 
     # Main summary table
     summary_table = Table(title="Reading Report")
@@ -46,48 +69,40 @@ def report(results: dict):
     for label, value in metrics:
         summary_table.add_row(label, str(value))
 
-    console.print(summary_table)
+    renderables += [summary_table, ""]
 
     # Top-3 Best Ranked Books
-    console.print()
     title_best = "Top-3 Best Ranked Books This Year"
-    df_best = results["best"]
-    best_table = Table(show_header=True, header_style="bold green", title=title_best)
-    for col in df_best.columns:
-        best_table.add_column(col.title().replace("_", " "), style="white")
-    for row in df_best.itertuples(index=False):
-        # Make sure values are strings
-        best_table.add_row(*[str(cell) for cell in row])
-    console.print(best_table)
+    best_table = _df_table(results["best"], title_best, "bold green")
+    renderables += [best_table, ""]
 
     # Last Book Read
-    console.print()
     title_last = "Last Book Read"
-    df_last = results["last"].copy()
-    df_last["end_date"] = df_last["end_date"].dt.strftime("%Y-%m-%d") # Date format to display
-    last_table = Table(show_header=True, header_style="bold blue", title=title_last)
-    for col in df_last.columns:
-        last_table.add_column(col.title().replace("_", " "), style="white")
-    for row in df_last.itertuples(index=False):
-        last_table.add_row(*[str(cell) for cell in row])
-    console.print(last_table)
+    df_last = results["last"]
+
+    if df_last.empty:
+        last_table = Table(title=title_last)
+        last_table.add_row("[italic]No completed books yet.[/italic]")
+    else:
+        # Date format to display, set on the string rows (no copy of the frame)
+        last_rows = df_last.to_numpy().astype(str)
+        last_rows[:, df_last.columns.get_loc("end_date")] = \
+        df_last["end_date"].to_numpy().astype("datetime64[D]").astype(str)
+        last_table = _df_table(df_last, title_last, "bold blue", rows=last_rows)
+    renderables += [last_table, ""]
 
     # New additions
-    console.print()
     title_new = "New Book Additions"
     df_new = results["new_entries"]
 
     if df_new.empty:
         new_table = Table(title=title_new)
         new_table.add_row(f"[italic]{results['feedback_new']}[/italic]")
-        console.print(new_table)
-        console.print()
+        renderables += [new_table, ""]
     else:
-        new_table = Table(show_header=True, header_style="bold red", title=title_new)
-        for col in df_new.columns:
-            new_table.add_column(col.title().replace("_", " "), style="white")
-        for row in df_new.itertuples(index=False):
-            new_table.add_row(*[str(cell) for cell in row])
-        console.print(new_table)
-        console.print(results["feedback_new"])
-        console.print()
+        new_table = _df_table(df_new, title_new, "bold red")
+        renderables += [new_table, results["feedback_new"], ""]
+
+    # Single render and write for the whole report
+    console.print(Group(*renderables))
+
@@ -1,3 +1,8 @@
+import functools
+import warnings
+from datetime import date
+
+import numpy as np
 import pandas as pd
 
 from elt.logger import get_logger
@@ -5,6 +10,34 @@ from elt.logger import get_logger
 # Set logger
 logger = get_logger(__name__)
 
+# Columns averaged for the reading rate measures
+RATE_COLS = ["pages_per_day", "days"]
+# Columns of the year subset used by the measures (the rest are never read)
+SUB_COLS = ["book_name", "author", "score", "end_date", "status", *RATE_COLS]
+# Columns shown for the last completed book and the new entries
+LAST_COLS = ["book_name", "author", "score", "end_date"]
+NEW_ENTRY_COLS = ["book_name", "author"]
+
+
+def _mean_rates(books: pd.DataFrame) -> np.ndarray:
+    """
+    Means of `RATE_COLS` (nulls skipped), rounded to 2 decimals, in one NumPy reduction
+    over a float64 block. A column with no values gives NaN, as with pandas.
+    """
+
+    values = books[RATE_COLS].to_numpy(dtype="float64", na_value=np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning) # "Mean of empty slice"
+        return np.nanmean(values, axis=0).round(2)
+
+
+@functools.lru_cache(maxsize=None)
+def _display_cols(columns: tuple[str, ...]) -> tuple[str, ...]:
+    """Report headers for `columns` ("book_name" -> "Book Name"), formatted once per column set."""
+
+    return tuple(col.title().replace("_", " ") for col in columns)
+
+
 def get_measures(
   transformed_books_current: pd.DataFrame,
   transformed_consolidate: pd.DataFrame,
@@ -54,10 +87,11 @@ def get_measures(
             Average reading duration for books completed in the specified year.
         - 'best' : pd.DataFrame  
             Top 3 highest-scoring books in the specified year.
+            Like 'last' and 'new_entries', its display headers are in `attrs["display_cols"]`.
         - 'last' : pd.DataFrame  
-            Most recently completed book in the specified year.
+            Most recently completed book in the specified year (empty if there is none).
         - 'days_since_last' : int  
-            Number of days since the last completed book.
+            Number of days since the last completed book, or -1 if there is none.
         - 'feedback_new' : str  
             Message indicating the number of new entries since the last run.
         - 'new_entries' : pd.DataFrame  
@@ -71,12 +105,15 @@ def get_measures(
         If data loading or transformation fails.
     """
 
+    # Reference date for the time-dependent measures
+    today = np.datetime64(date.today(), "D") # Local date, as Timestamp.today()
+
     # Parameter validation
     min_year_available = int(transformed_books_current["year"].min())
     max_year_available = int(transformed_books_current["year"].max())
 
     if not isinstance(year, int):
-        logger.exception("Invalid parameter format: year")
+        logger.error("Invalid parameter format: year")
         raise ValueError("The year should be a positive integer.")
     
     if year < min_year_available or year > max_year_available:
@@ -88,43 +125,63 @@ def get_measures(
     
     ## Summary measures ##
 
-    # Counts
-    overall_total = (
-        transformed_consolidate.shape[0] + transformed_books_current[transformed_books_current["status"] == "Completed"].shape[0]
-    )
-    total_current = transformed_books_current.query(f'status == "Completed" & year == {year}').shape[0]
-    ongoing = transformed_books_current.query('status == "Ongoing"').shape[0]
-    dropped = transformed_books_current.query('status == "Dropped"').shape[0]
-
-    # Averages
-    mean_pages_per_day = transformed_books_current["pages_per_day"].dropna().mean().round(2)
-    mean_time_reading = transformed_books_current["days"].dropna().mean().round(2)
-    # Current year subset for the following measures
-    sub = transformed_books_current.query(f"year == {year}")
-    mean_pages_per_day_current = sub["pages_per_day"].dropna().mean().round(2)
-    mean_time_reading_current = sub["days"].dropna().mean().round(2)
+    # Current year subset for the following measures (rows and columns in one take)
+    year_mask = transformed_books_current["year"].to_numpy() == year
+    sub = transformed_books_current.loc[year_mask, SUB_COLS]
+
+    # Counts (one pass over the status column)
+    status_counts = transformed_books_current["status"].value_counts()
+    # Completed mask of the subset, shared by the count and the last book lookup
+    # (compared on the category codes; to_numpy() first would compare Python strings)
+    sub_completed = (sub["status"] == "Completed").to_numpy()
+    overall_total = transformed_consolidate.shape[0] + int(status_counts.get("Completed", 0))
+    total_current = int(sub_completed.sum())
+    ongoing = int(status_counts.get("Ongoing", 0))
+    dropped = int(status_counts.get("Dropped", 0))
+
+    # Averages (both columns in one reduction; nulls are skipped)
+    mean_pages_per_day, mean_time_reading = _mean_rates(transformed_books_current)
+    mean_pages_per_day_current, mean_time_reading_current = _mean_rates(sub)
 
     # Top-3 best ranked books in the current year
     best = sub.nlargest(3, "score")[["book_name", "author", "score"]].reset_index(drop=True)  # Include ties
 
-    # Last complete reading
-    last = sub.loc[
-      sub["status"] == "Completed",
-      ["book_name", "author", "score", "end_date"]
-    ].sort_values(by="end_date").tail(1).reset_index(drop=True)
-    
-    days_since_last = (pd.to_datetime("today") - last["end_date"].iloc[0]).days
+    # Last complete reading (linear scan for the latest end date, no sort or filtered frame)
+    end_vals = sub["end_date"].to_numpy()
+    completed_pos = np.flatnonzero(sub_completed)
+    if completed_pos.size:
+        last_pos = completed_pos[end_vals[completed_pos].argmax()]
+        last = sub.iloc[[last_pos]][LAST_COLS].reset_index(drop=True)
+        days_since_last = int((today - end_vals[last_pos].astype("datetime64[D]")) / np.timedelta64(1, "D"))
+    else:
+        # No completed books in the year yet
+        last = pd.DataFrame(columns=LAST_COLS)
+        days_since_last = -1
 
     # New entries
     if len(transformed_records) >= 2:
         diff = transformed_records["records_current"].iloc[-1] - transformed_records["records_current"].iloc[-2]
-        format_last_date = \
-        last["end_date"].iloc[-1].strftime("%Y-%m-%d")
-        feedback_new = f"New entries since {format_last_date}: {diff}."
-        new_entries = transformed_books_current.tail(diff)[["book_name", "author"]].reset_index(drop=True)
+        if last.empty:
+            feedback_new = f"New entries: {diff}."
+        else:
+            format_last_date = \
+            last["end_date"].iloc[-1].strftime("%Y-%m-%d")
+            feedback_new = f"New entries since {format_last_date}: {diff}."
+        if diff > 0:
+            # Raw array slices: no column projection or index alignment
+            start = max(len(transformed_books_current) - diff, 0)
+            new_entries = pd.DataFrame({
+                col: transformed_books_current[col].to_numpy()[start:] for col in NEW_ENTRY_COLS
+            })
+        else:
+            new_entries = pd.DataFrame(columns=NEW_ENTRY_COLS) # Nothing added (or rows removed)
     else:
         feedback_new = "No new entries to show." # Only for the first execution or no new entries case
-        new_entries = pd.DataFrame(columns=["book_name", "author"])  
+        new_entries = pd.DataFrame(columns=NEW_ENTRY_COLS)  
+
+    # Display headers for the report tables, computed once with the frames
+    for df in (best, last, new_entries):
+        df.attrs["display_cols"] = _display_cols(tuple(df.columns))
 
     # Dictionary to store results
     results = {
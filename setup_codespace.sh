@@ -16,9 +16,6 @@ echo "Installing requirements..."
 pip install --upgrade pip
 pip install -r requirements.txt
 
-echo "Loading credentials..."
-python load_credentials.py
-
 echo "Setup complete."
 
 # Use this file only on GitHub's codespace
\ No newline at end of file
@@ -1,12 +1,12 @@
 import pandas as pd
 import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+from google.oauth2.service_account import Credentials
 
 scope = [
     "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive"
 ]
-creds = ServiceAccountCredentials.from_json_keyfile_name("book_tracker_creds.json", scope)
+creds = Credentials.from_service_account_file("book_tracker_creds.json", scopes=scope)
 client = gspread.authorize(creds)
 
 sheet = client.open_by_key("1mRx4CClu1io5Ievu9b5PTJ6nIEDOFfl-oFgIv55Q37g").sheet1
@@ -14,6 +14,17 @@ data = sheet.get_all_records()
 df = pd.DataFrame(data)
 #print(df.info())
 print(df["score"].sample(5))
-df_copy = df.copy()
-df_copy["score"] = pd.to_numeric(df_copy["score"], errors="coerce")
-print(df_copy.info())
+df["score"] = pd.to_numeric(df["score"], errors="coerce") # Only this column is converted
+print(df.info())
+
+# Sheet cache: with the sheet unchanged, a second extraction must not call batchGet
+import tempfile
+from unittest import mock
+
+from elt import extract as extract_module
+
+with tempfile.TemporaryDirectory() as cache_dir:
+    extract_module.extract(directory=cache_dir)
+    with mock.patch.object(extract_module, "_batch_get", side_effect=AssertionError("batchGet called")):
+        extract_module.extract(directory=cache_dir)
+print("Sheet cache reused on the second extraction.")